@@ -7,17 +7,74 @@ Copyright (c) 2025 ponponusa
 MIT License
 """
 
+import os
 import re
 import argparse
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pickle import PicklingError
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, Counter as CounterType, Dict, Iterator, List, Tuple, Optional, Pattern
 from dataclasses import dataclass
 
 
+# 見出し
+_H1_RE = re.compile(r'^# [^#]')
+_H4_RE = re.compile(r'^(#{4,})\s+(.+)$')
+
+# 数式記法
+# 数式の開始候補（\[, \(, \$, $ またはコードフェンス行）
+_MATH_TOKEN_RE = re.compile(r'\\[\[($]|\$|^[ \t]*```', re.MULTILINE)
+_CODE_FENCE_RE = re.compile(r'^[ \t]*```', re.MULTILINE)
+_DOLLAR_END_RE = re.compile(r'[\n$]')
+
+# 数式ブロック内の演算子行
+_OP_ONLY_RE = re.compile(r'^[\s]*[=≈≃+\-][\s]*$')
+_LATEX_OP_RE = re.compile(r'^[\s]*\\(simeq|approx|equiv|leq|geq|neq|le|ge|ne)[\s]*$')
+_STARTS_OP_RE = re.compile(r'^[\s]*[+\-]\s+\S')
+
+# テーブル
+_TABLE_SEP_RE = re.compile(r'[-:]+')
+_BOLD_STAR_RE = re.compile(r'\*\*(.+?)\*\*')
+_BOLD_UNDER_RE = re.compile(r'__(.+?)__')
+_LINK_RE = re.compile(r'\[(.+?)\]\(.+?\)')
+_CELL_MATH_RE = re.compile(r'\$\$\{(.+?)\}\$\$')
+_TEXT_OPEN = '\\text{'
+_TEXT_CLOSE = '}'
+
+# LaTeX arrayの部品
+# note.comのエディタでは複数行まとめて貼り付けると\がエスケープされるため、\\を出力するには\\\\と書く必要がある
+_LINE_BREAK = '\\\\\\\\'
+_ROW_END = ' ' + _LINE_BREAK
+_HLINE = '\\hline'
+_HDASHLINE = '\\hdashline'
+
+# HTMLタグ・脚注
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_FOOTNOTE_RE = re.compile(r'\[\^.+?\]')
+
+# 警告メッセージ（定数を共有して警告ごとの文字列生成を避ける）
+_MSG_YAML_REMOVED = "YAML Front Matterを削除しました"
+_MSG_H1_TO_H2 = "H1をH2に変換しました"
+_MSG_MATH_CONVERTED = "数式記法をnote.com形式に変換しました"
+_MSG_INVALID_TABLE = "不正な形式のテーブルです"
+_MSG_TABLE_CONVERTED = "テーブルをLaTeX array形式に変換しました（Markdownのアライメントを保持）"
+_MSG_HTML_DETECTED = "HTMLタグを検出しました（noteでは非サポート）"
+_MSG_FOOTNOTE = "脚注記法を検出しました（noteでは非サポート、手動でインライン化してください）"
+
+# レポートに表示するメッセージの種類数（重要度ごと）
+_MAX_REPORTED = 10
+
+
 @dataclass
 class ConversionWarning:
     """変換時の警告情報"""
+    __slots__ = ('file', 'line', 'message', 'severity')
+    
     file: str
     line: int
     message: str
@@ -34,7 +91,37 @@ class NoteMarkdownConverter:
             verbose (bool): 詳細なログを出力するかどうか。デフォルトはFalse。
         """
         self.verbose = verbose
-        self.warnings: List[ConversionWarning] = []
+        # (重要度, メッセージ)ごとの件数
+        self.warning_counts: CounterType[Tuple[str, str]] = Counter()
+        # (重要度, メッセージ)ごとの最初の出現箇所（メッセージの種類数で上限が決まる）
+        self._first_seen: Dict[Tuple[str, str], ConversionWarning] = {}
+        # 記録する重要度（情報メッセージは表示されないため、verboseでない場合は記録しない）
+        self._severities: Tuple[str, ...] = ('error', 'warning', 'info') if verbose else ('error', 'warning')
+    
+    def _add_warning(self, warning: ConversionWarning) -> None:
+        """警告を記録し、(重要度, メッセージ)ごとの件数を更新します。
+        
+        Args:
+            warning (ConversionWarning): 記録する警告。
+        """
+        if warning.severity not in self._severities:
+            return
+        
+        key = (warning.severity, warning.message)
+        self._first_seen.setdefault(key, warning)
+        self.warning_counts[key] += 1
+    
+    def merge_warnings(self, other: 'NoteMarkdownConverter') -> None:
+        """別のコンバーターで収集された警告と件数を取り込みます。
+        
+        Args:
+            other (NoteMarkdownConverter): 取り込み元のコンバーター。
+        """
+        for key, count in other.warning_counts.items():
+            if key[0] not in self._severities:
+                continue
+            self._first_seen.setdefault(key, other._first_seen[key])
+            self.warning_counts[key] += count
     
     def convert(self, content: str, filename: str = "") -> str:
         """Markdownコンテンツをnote.com用の記法に変換します。
@@ -51,6 +138,7 @@ class NoteMarkdownConverter:
         
         lines = content.split('\n')
         converted_lines = []
+        in_code_fence = False
         i = 0
         
         while i < len(lines):
@@ -61,6 +149,15 @@ class NoteMarkdownConverter:
                 i = self._skip_yaml_front_matter(lines, i)
                 continue
             
+            # コードフェンス内の行は変換せずそのまま出力
+            is_fence = line.lstrip().startswith('```')
+            if is_fence or in_code_fence:
+                if is_fence:
+                    in_code_fence = not in_code_fence
+                converted_lines.append(line)
+                i += 1
+                continue
+            
             # Markdownテーブルの検出と変換
             if self._is_table_line(line):
                 table_lines, next_i = self._extract_table(lines, i)
@@ -95,12 +192,13 @@ class NoteMarkdownConverter:
         """
         for i in range(start + 1, len(lines)):
             if lines[i].strip() == '---':
-                self.warnings.append(ConversionWarning(
-                    file="",
-                    line=start + 1,
-                    message="YAML Front Matterを削除しました",
-                    severity="info"
-                ))
+                if self.verbose:
+                    self._add_warning(ConversionWarning(
+                        file="",
+                        line=start + 1,
+                        message=_MSG_YAML_REMOVED,
+                        severity="info"
+                    ))
                 return i + 1
         return start + 1
     
@@ -116,22 +214,26 @@ class NoteMarkdownConverter:
         Returns:
             str: 変換後の行。
         """
+        # 見出しでない行は正規表現を使わずに返す
+        if not line.startswith('#'):
+            return line
+        
         # H1 (#) → H2 (##)
-        if re.match(r'^# [^#]', line):
+        if _H1_RE.match(line):
             if self.verbose:
-                self.warnings.append(ConversionWarning(
+                self._add_warning(ConversionWarning(
                     file="",
                     line=0,
-                    message="H1をH2に変換しました",
+                    message=_MSG_H1_TO_H2,
                     severity="info"
                 ))
             return '#' + line
         
         # H4以降 (####, #####, ######) → H3 (###)
-        match = re.match(r'^(#{4,})\s+(.+)$', line)
+        match = _H4_RE.match(line)
         if match:
             if self.verbose:
-                self.warnings.append(ConversionWarning(
+                self._add_warning(ConversionWarning(
                     file="",
                     line=0,
                     message=f"H{len(match.group(1))}をH3に変換しました",
@@ -153,8 +255,9 @@ class NoteMarkdownConverter:
         2. \(...\) → $${...}$$（インライン数式、複数行対応）
         3. $`...`$ → $${...}$$（GitHub/Markdown拡張記法、インライン）
         4. $...$ → $${...}$$（単一ドル記法、インライン）
+        5. 数式ブロック内の演算子のみの行を前の行の末尾に移動
         
-        注意: 既存の$$...$$ブロックはそのまま保持されます。
+        注意: 既存の$$...$$ブロックとコードフェンス内はそのまま保持されます。
         
         Args:
             content (str): 変換対象のMarkdownテキスト。
@@ -165,96 +268,171 @@ class NoteMarkdownConverter:
         """
         original = content
         
-        # 1. \[...\] をディスプレイ数式に変換（複数行対応）
-        content = re.sub(
-            r'\\\[\s*(.*?)\s*\\\]',
-            lambda m: '$$\n' + m.group(1).strip() + '\n$$',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # 2. \(...\) をインライン数式に変換（複数行対応）
-        content = re.sub(
-            r'\\\(\s*(.*?)\s*\\\)',
-            lambda m: '$${' + m.group(1).strip() + '}$$',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # 3. $`...`$ をインライン数式に変換（GitHub/Markdown拡張記法）
-        content = re.sub(
-            r'\$`([^`]+?)`\$',
-            lambda m: '$${' + m.group(1).strip() + '}$$',
-            content
-        )
-        
-        # 4. $...$ をインライン数式に変換
-        # $$...$$と区別するため、前後に$がないことを確認
-        # また、改行を含まない単一行の数式のみ対象
-        content = re.sub(
-            r'(?<!\$)\$(?!\$)([^\n$]+?)\$(?!\$)',
-            lambda m: '$${' + m.group(1).strip() + '}$$',
-            content
-        )
-        
-        # 5. 数式ブロック内の演算子のみの行を前の行の末尾に移動
-        # note.comでは =, \le, +, - などが単独行にあると問題になる
-        def fix_operator_lines(match):
-            lines = match.group(0).split('\n')
-            fixed_lines = []
-            i = 0
-            while i < len(lines):
-                line = lines[i]
-                # 次の行をチェック
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    
-                    # パターン1: 演算子のみの行（=, +, - など）
-                    is_operator_only = re.match(r'^[\s]*[=≈≃+\-][\s]*$', next_line)
-                    
-                    # パターン2: LaTeX演算子のみの行（\le, \simeq など）
-                    is_latex_operator_only = re.match(
-                        r'^[\s]*\\(simeq|approx|equiv|leq|geq|neq|le|ge|ne)[\s]*$', 
-                        next_line
-                    )
-                    
-                    # パターン3: 行頭が演算子（+ M_info など）
-                    starts_with_operator = re.match(r'^[\s]*[+\-]\s+\S', next_line)
-                    
-                    if is_operator_only or is_latex_operator_only:
-                        # 演算子のみの行を現在の行の末尾に追加
-                        fixed_lines.append(line.rstrip() + ' ' + next_line.strip())
-                        i += 2  # 次の行をスキップ
-                        continue
-                    elif starts_with_operator and line.strip():
-                        # 行頭の演算子を前の行の末尾に移動
-                        fixed_lines.append(line.rstrip() + ' ' + next_line.strip())
-                        i += 2
-                        continue
-                        
-                fixed_lines.append(line)
-                i += 1
-            return '\n'.join(fixed_lines)
-        
-        # $$...$$ブロックに対して適用（開始$$の直後の改行はオプション）
-        content = re.sub(
-            r'\$\$\s*\n?(.*?)\n?\s*\$\$',
-            fix_operator_lines,
-            content,
-            flags=re.DOTALL
-        )
+        # 1〜4. 数式記法を1回の走査で変換（5. 演算子行の修正も同時に行う）
+        content = self._convert_math_notation_scan(content)
         
         # 変換が行われた場合、情報メッセージを追加
         if content != original and self.verbose:
-            self.warnings.append(ConversionWarning(
+            self._add_warning(ConversionWarning(
                 file=filename,
                 line=0,
-                message="数式記法をnote.com形式に変換しました",
+                message=_MSG_MATH_CONVERTED,
                 severity="info"
             ))
         
         return content
     
+    def _fix_operator_lines(self, block: str) -> str:
+        r"""数式ブロック内の演算子のみの行を前の行の末尾に移動します。
+        
+        note.comでは =, \le, +, - などが単独行にあると問題になります。
+        
+        Args:
+            block (str): $$で囲まれた数式ブロック（区切りの$$を含む）。
+        
+        Returns:
+            str: 演算子行を修正した数式ブロック。
+        """
+        # 1行のブロックは修正対象がない
+        if '\n' not in block:
+            return block
+        
+        # ループ内の属性参照を避けるためローカルに束縛
+        op_only = _OP_ONLY_RE.match
+        latex_op_only = _LATEX_OP_RE.match
+        starts_op = _STARTS_OP_RE.match
+        
+        lines = block.split('\n')
+        fixed_lines = []
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            # 次の行をチェック
+            if i + 1 < len(lines):
+                next_line = lines[i + 1].strip()
+                
+                # パターン1: 演算子のみの行（=, +, - など）
+                is_operator_only = op_only(next_line)
+                
+                # パターン2: LaTeX演算子のみの行（\le, \simeq など）
+                is_latex_operator_only = latex_op_only(next_line)
+                
+                # パターン3: 行頭が演算子（+ M_info など）
+                starts_with_operator = starts_op(next_line)
+                
+                if is_operator_only or is_latex_operator_only:
+                    # 演算子のみの行を現在の行の末尾に追加
+                    fixed_lines.append(f'{line.rstrip()} {next_line}')
+                    i += 2  # 次の行をスキップ
+                    continue
+                elif starts_with_operator and line.strip():
+                    # 行頭の演算子を前の行の末尾に移動
+                    fixed_lines.append(f'{line.rstrip()} {next_line}')
+                    i += 2
+                    continue
+                    
+            fixed_lines.append(line)
+            i += 1
+        return '\n'.join(fixed_lines)
+    
+    def _convert_math_notation_scan(self, content: str) -> str:
+        r"""数式記法（\[...\], \(...\), $`...`$, $...$）を先頭から1回の走査で変換します。
+        
+        正規表現のバックトラックに頼らず、区切り記号の対応を str.find で探すため、
+        閉じていない \[ などが多数あっても処理時間は入力長に比例します。
+        変換済みの数式や既存の$$...$$ブロック、コードフェンス内は再変換しません。
+        出力する$$...$$ブロックには演算子行の修正（_fix_operator_lines）を適用します。
+        
+        Args:
+            content (str): 変換対象のMarkdownテキスト。
+        
+        Returns:
+            str: 数式記法を変換後のテキスト。
+        """
+        out = []
+        n = len(content)
+        i = 0
+        # 閉じ記号が以降に存在しないことが分かった区切り（再検索を避ける）
+        unclosed = set()
+        
+        while i < n:
+            m = _MATH_TOKEN_RE.search(content, i)
+            if not m:
+                break
+            p = m.start()
+            out.append(content[i:p])
+            token = m.group(0)
+            
+            # コードフェンス: 閉じフェンスの行末までそのまま出力
+            if token.endswith('```'):
+                close = _CODE_FENCE_RE.search(content, m.end())
+                if not close:
+                    out.append(content[p:])
+                    return ''.join(out)
+                end = content.find('\n', close.end())
+                end = n if end == -1 else end + 1
+                out.append(content[p:end])
+                i = end
+                continue
+            
+            # \[...\] → ディスプレイ数式 / \(...\) → インライン数式
+            if token in ('\\[', '\\('):
+                closer = '\\]' if token == '\\[' else '\\)'
+                j = -1 if closer in unclosed else content.find(closer, p + 2)
+                if j == -1:
+                    unclosed.add(closer)
+                    out.append(token)
+                    i = p + 2
+                    continue
+                inner = content[p + 2:j].strip()
+                if token == '\\[':
+                    out.append(self._fix_operator_lines('$$\n' + inner + '\n$$'))
+                else:
+                    out.append(self._fix_operator_lines('$${' + inner + '}$$'))
+                i = j + 2
+                continue
+            
+            # エスケープされた \$ はそのまま
+            if token == '\\$':
+                out.append(token)
+                i = p + 2
+                continue
+            
+            # 既存の$$...$$ブロック（変換済みのインライン数式を含む）はそのまま
+            if content.startswith('$$', p):
+                j = -1 if '$$' in unclosed else content.find('$$', p + 2)
+                if j == -1:
+                    unclosed.add('$$')
+                    out.append('$$')
+                    i = p + 2
+                else:
+                    out.append(self._fix_operator_lines(content[p:j + 2]))
+                    i = j + 2
+                continue
+            
+            # $`...`$ → インライン数式（GitHub/Markdown拡張記法）
+            if content.startswith('`', p + 1):
+                j = content.find('`', p + 2)
+                if j > p + 2 and content.startswith('$', j + 1):
+                    out.append(self._fix_operator_lines('$${' + content[p + 2:j].strip() + '}$$'))
+                    i = j + 2
+                    continue
+            
+            # $...$ → インライン数式
+            # 直前が$の場合や、閉じ$の直後に$が続く場合は対象外（改行を含まない単一行のみ）
+            if p == 0 or content[p - 1] != '$':
+                end = _DOLLAR_END_RE.search(content, p + 1)
+                if end and end.group(0) == '$' and end.start() > p + 1 and not content.startswith('$', end.end()):
+                    out.append('$${' + content[p + 1:end.start()].strip() + '}$$')
+                    i = end.end()
+                    continue
+            
+            out.append('$')
+            i = p + 1
+        
+        out.append(content[i:])
+        return ''.join(out)
+    
     def _is_table_line(self, line: str) -> bool:
         """指定された行がMarkdownテーブルの一部かどうかを判定します。
         
@@ -264,9 +442,15 @@ class NoteMarkdownConverter:
         Returns:
             bool: テーブル行の場合True、それ以外はFalse。
         """
+        # | を含まない行（大半の行）はすぐに除外
+        if '|' not in line:
+            return False
+        
         stripped = line.strip()
-        # | で始まり | で終わるか、| が2つ以上含まれる
-        return bool(stripped and (stripped.startswith('|') or stripped.count('|') >= 2))
+        # | で始まるか、| が2つ以上含まれる（2つ目が見つかった時点で打ち切り）
+        if stripped.startswith('|'):
+            return True
+        return stripped.find('|', stripped.find('|') + 1) != -1
     
     def _extract_table(self, lines: List[str], start: int) -> Tuple[List[str], int]:
         """連続するテーブル行を抽出します。
@@ -305,10 +489,10 @@ class NoteMarkdownConverter:
             str: LaTeX array形式に変換されたテーブル文字列（$$で囲まれた形式）。
         """
         if len(table_lines) < 2:
-            self.warnings.append(ConversionWarning(
+            self._add_warning(ConversionWarning(
                 file=filename,
                 line=line_num,
-                message="不正な形式のテーブルです",
+                message=_MSG_INVALID_TABLE,
                 severity="warning"
             ))
             return '\n'.join(table_lines)
@@ -318,7 +502,7 @@ class NoteMarkdownConverter:
         
         # セパレーター行から列のアライメントを取得
         alignments = []
-        if len(table_lines) > 1 and re.search(r'[-:]+', table_lines[1]):
+        if len(table_lines) > 1 and _TABLE_SEP_RE.search(table_lines[1]):
             separator = table_lines[1]
             sep_cells = self._parse_table_row(separator)
             
@@ -341,8 +525,8 @@ class NoteMarkdownConverter:
         num_cols = len(header_cells)
         
         # アライメント配列を列数に合わせる
-        while len(alignments) < num_cols:
-            alignments.append('l')
+        if len(alignments) < num_cols:
+            alignments.extend(['l'] * (num_cols - len(alignments)))
         alignments = alignments[:num_cols]
         
         # データ行を解析
@@ -355,39 +539,37 @@ class NoteMarkdownConverter:
         # LaTeX array形式に変換（外側に縦罫線、内側は罫線なし、読みやすいスタイル）
         col_spec = ''.join(alignments)
         
-        latex_lines = ['$$', f'\\begin{{array}}{{|{col_spec}|}} \\hline']
+        latex_lines = ['$$', '\\begin{array}{|' + col_spec + '|} ' + _HLINE]
         
         # ヘッダー行（上下に改行を入れて強調）
-        # note.comのエディタでは複数行まとめて貼り付けると\がエスケープされるため、\\を出力するには\\\\と書く必要がある
         header_row = ' & '.join(self._clean_cell(cell) for cell in header_cells)
-        latex_lines.append(f'\\\\\\\\{header_row} \\\\\\\\')
-        latex_lines.append('\\hline \\hline')
+        latex_lines.append(_LINE_BREAK + header_row + _ROW_END)
+        latex_lines.append(_HLINE + ' ' + _HLINE)
         
         # データ行（破線で区切り）
+        last = len(data_rows) - 1
         for i, row in enumerate(data_rows):
             # 列数を揃える
-            while len(row) < num_cols:
-                row.append('')
+            if len(row) < num_cols:
+                row.extend([''] * (num_cols - len(row)))
             row = row[:num_cols]
             
             data_row = ' & '.join(self._clean_cell(cell) for cell in row)
-            latex_lines.append(f'{data_row} \\\\\\\\')
+            latex_lines.append(data_row + _ROW_END)
             
             # 最後の行は実線、それ以外は破線
-            if i == len(data_rows) - 1:
-                latex_lines.append('\\hline')
-            else:
-                latex_lines.append('\\hdashline')
+            latex_lines.append(_HLINE if i == last else _HDASHLINE)
         
         latex_lines.append('\\end{array}')
         latex_lines.append('$$')
         
-        self.warnings.append(ConversionWarning(
-            file=filename,
-            line=line_num,
-            message="テーブルをLaTeX array形式に変換しました（Markdownのアライメントを保持）",
-            severity="info"
-        ))
+        if self.verbose:
+            self._add_warning(ConversionWarning(
+                file=filename,
+                line=line_num,
+                message=_MSG_TABLE_CONVERTED,
+                severity="info"
+            ))
         
         return '\n'.join(latex_lines)
     
@@ -400,16 +582,16 @@ class NoteMarkdownConverter:
         Returns:
             List[str]: セル内容のリスト。
         """
-        # 前後の | を削除
-        line = line.strip()
-        if line.startswith('|'):
-            line = line[1:]
-        if line.endswith('|'):
-            line = line[:-1]
-        
         # | で分割
-        cells = [cell.strip() for cell in line.split('|')]
-        return cells
+        parts = line.strip().split('|')
+        
+        # 前後の | による空要素を削除
+        if len(parts) > 1 and not parts[0]:
+            del parts[0]
+        if len(parts) > 1 and not parts[-1]:
+            del parts[-1]
+        
+        return [cell.strip() for cell in parts]
     
     def _clean_cell(self, cell: str) -> str:
         """テーブルセルの内容をnote.com用のLaTeX array形式に整形します。
@@ -430,48 +612,38 @@ class NoteMarkdownConverter:
             return ''
         
         # Markdownの装飾を除去（数式の外側のみ）
-        cell = re.sub(r'\*\*(.+?)\*\*', r'\1', cell)  # 太字
-        cell = re.sub(r'__(.+?)__', r'\1', cell)      # 太字
+        # 記号を含まないセルでは正規表現を呼ばない
+        if '**' in cell:
+            cell = _BOLD_STAR_RE.sub(r'\1', cell)   # 太字
+        if '__' in cell:
+            cell = _BOLD_UNDER_RE.sub(r'\1', cell)  # 太字
         
         # リンクを除去（テキストのみ残す）
-        cell = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', cell)
+        if '](' in cell:
+            cell = _LINK_RE.sub(r'\1', cell)
         
-        # 数式記法を含むかチェック
-        math_pattern = r'\$\$\{(.+?)\}\$\$'
-        has_math = bool(re.search(math_pattern, cell))
+        # 数式部分で分割（テキスト, 数式, テキスト, 数式, ..., テキスト の順に並ぶ）
+        pieces = _CELL_MATH_RE.split(cell)
         
-        if has_math:
+        if len(pieces) > 1:
             # 数式とテキストが混在している可能性がある
-            # 数式部分とテキスト部分を分離して処理
+            # 奇数番目が数式部分（波括弧を外した中身）、偶数番目がテキスト部分
             parts = []
-            last_end = 0
-            
-            for match in re.finditer(math_pattern, cell):
-                # 数式の前のテキスト部分
-                if match.start() > last_end:
-                    text_part = cell[last_end:match.start()].strip()
+            for idx, piece in enumerate(pieces):
+                if idx % 2:
+                    parts.append(piece)
+                else:
+                    text_part = piece.strip()
                     if text_part:
-                        parts.append(f'\\text{{{text_part}}}')
-                
-                # 数式部分（波括弧を外す）
-                math_part = match.group(1)
-                parts.append(math_part)
-                
-                last_end = match.end()
-            
-            # 最後の数式の後のテキスト部分
-            if last_end < len(cell):
-                text_part = cell[last_end:].strip()
-                if text_part:
-                    parts.append(f'\\text{{{text_part}}}')
+                        parts.append(_TEXT_OPEN + text_part + _TEXT_CLOSE)
             
             # 空白で結合
-            return ' '.join(parts) if parts else ''
+            return ' '.join(parts)
         else:
             # テキストのみの場合は\text{}で囲む
             cell = cell.strip()
-            if cell and not cell.startswith('\\text{'):
-                cell = f'\\text{{{cell}}}'
+            if cell and not cell.startswith(_TEXT_OPEN):
+                cell = _TEXT_OPEN + cell + _TEXT_CLOSE
             return cell
     
     def _remove_html_tags(self, line: str, filename: str, line_num: int) -> str:
@@ -485,21 +657,25 @@ class NoteMarkdownConverter:
         Returns:
             str: HTMLタグが除去された行。
         """
-        if '<' in line and '>' in line:
-            # コメントは完全削除
-            if '<!--' in line:
-                line = re.sub(r'<!--.*?-->', '', line)
-            
-            # その他のHTMLタグを検出
-            if re.search(r'<[^>]+>', line):
-                self.warnings.append(ConversionWarning(
-                    file=filename,
-                    line=line_num,
-                    message="HTMLタグを検出しました（noteでは非サポート）",
-                    severity="warning"
-                ))
-                # 基本的なHTMLタグを除去（内容は保持）
-                line = re.sub(r'<[^>]+>', '', line)
+        # タグやコメントは < の後ろに > がある場合のみ成立する
+        lt = line.find('<')
+        if lt == -1 or line.rfind('>') <= lt:
+            return line
+        
+        # コメントは完全削除
+        if '<!--' in line:
+            line = _HTML_COMMENT_RE.sub('', line)
+        
+        # その他のHTMLタグを検出
+        if _HTML_TAG_RE.search(line):
+            self._add_warning(ConversionWarning(
+                file=filename,
+                line=line_num,
+                message=_MSG_HTML_DETECTED,
+                severity="warning"
+            ))
+            # 基本的なHTMLタグを除去（内容は保持）
+            line = _HTML_TAG_RE.sub('', line)
         
         return line
     
@@ -514,11 +690,11 @@ class NoteMarkdownConverter:
         Returns:
             str: 元の行（変更なし）。
         """
-        if re.search(r'\[\^.+?\]', line):
-            self.warnings.append(ConversionWarning(
+        if '[^' in line and _FOOTNOTE_RE.search(line):
+            self._add_warning(ConversionWarning(
                 file=filename,
                 line=line_num,
-                message="脚注記法を検出しました（noteでは非サポート、手動でインライン化してください）",
+                message=_MSG_FOOTNOTE,
                 severity="warning"
             ))
         return line
@@ -527,32 +703,116 @@ class NoteMarkdownConverter:
         """収集された警告・エラー・情報メッセージを整形して出力します。
         
         重要度別（エラー、警告、情報）に分類して表示します。
-        各カテゴリーで最大10件まで表示されます。
+        同じメッセージは最初の出現箇所と件数にまとめ、各カテゴリーで最大10種類まで表示されます。
+        情報メッセージはverboseの場合のみ記録・表示されます。
         """
-        if not self.warnings:
+        if not self.warning_counts:
             return
         
         print("\n=== 変換レポート ===")
         
-        # 重要度別に分類
-        errors = [w for w in self.warnings if w.severity == 'error']
-        warnings = [w for w in self.warnings if w.severity == 'warning']
-        infos = [w for w in self.warnings if w.severity == 'info']
-        
-        if errors:
-            print(f"\n❌ エラー ({len(errors)}件):")
-            for w in errors[:10]:  # 最大10件表示
-                print(f"  {w.file}:{w.line} - {w.message}")
-        
-        if warnings:
-            print(f"\n⚠️  警告 ({len(warnings)}件):")
-            for w in warnings[:10]:
-                print(f"  {w.file}:{w.line} - {w.message}")
-        
-        if self.verbose and infos:
-            print(f"\nℹ️  情報 ({len(infos)}件):")
-            for w in infos[:10]:
-                print(f"  {w.file}:{w.line} - {w.message}")
+        labels = {'error': '❌ エラー', 'warning': '⚠️  警告', 'info': 'ℹ️  情報'}
+        
+        for severity in self._severities:
+            # 件数の多いメッセージ順
+            groups = [(key, count) for key, count in self.warning_counts.most_common() if key[0] == severity]
+            if not groups:
+                continue
+            
+            print(f"\n{labels[severity]} ({sum(count for _, count in groups)}件):")
+            for key, count in groups[:_MAX_REPORTED]:
+                w = self._first_seen[key]
+                others = f"（他{count - 1}件）" if count > 1 else ""
+                print(f"  {w.file}:{w.line} - {w.message}{others}")
+
+
+def _iter_md_files(root: Path, exclude_re: Optional[Pattern[str]] = None) -> Iterator[Path]:
+    """フォルダ以下の変換対象.mdファイルを列挙します。
+    
+    ディレクトリを1回だけ走査し、ファイル名で絞り込んでから Path を生成します。
+    
+    Args:
+        root (Path): 検索を開始するフォルダパス。
+        exclude_re (Optional[Pattern[str]]): パスに一致した場合に除外する正規表現。デフォルトはNone。
+    
+    Yields:
+        Path: 変換対象の.mdファイル（.note.mdファイルは除く）。
+    """
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            # 拡張子の大文字小文字はプラットフォームの規則に従う（Path.rglob と同じ）
+            if not os.path.normcase(name).endswith('.md') or name.endswith('.note.md'):
+                continue
+            # 除外パターンは従来どおり str(Path) に対して照合する
+            path = Path(dirpath, name)
+            if exclude_re is not None and exclude_re.search(str(path)):
+                continue
+            yield path
+
+
+def _convert_one(md_file: Path, verbose: bool = False, dry_run: bool = False) -> Tuple[bool, str, NoteMarkdownConverter]:
+    """1つの.mdファイルを変換します（ワーカープロセスで実行）。
+    
+    各呼び出しで独自のコンバーターを生成するため、プロセス間で状態を共有しません。
+    
+    Args:
+        md_file (Path): 変換対象の.mdファイル。
+        verbose (bool): 詳細なログを出力するかどうか。デフォルトはFalse。
+        dry_run (bool): Trueの場合、実際には書き込まずプレビューのみ。デフォルトはFalse。
+    
+    Returns:
+        Tuple[bool, str, NoteMarkdownConverter]: (書き込みに成功したか, 表示用メッセージ, 警告を収集したコンバーター)
+    """
+    converter = NoteMarkdownConverter(verbose=verbose)
+    try:
+        # ファイルを読み込み
+        content = md_file.read_text(encoding='utf-8')
+        
+        # 変換
+        converted = converter.convert(content, str(md_file))
+        
+        # 出力ファイル名を生成
+        output_file = md_file.parent / f"{md_file.stem}.note.md"
+        
+        if dry_run:
+            return False, f"[DRY-RUN] {md_file.name} → {output_file.name}", converter
+        
+        # ファイルに書き込み
+        output_file.write_text(converted, encoding='utf-8')
+        return True, f"✅ {md_file.name} → {output_file.name}", converter
+    
+    except Exception as e:
+        return False, f"❌ エラー: {md_file.name} - {e}", converter
+
+
+def _map_in_pool(worker: Callable[[Path], Tuple[bool, str, NoteMarkdownConverter]], md_files: List[Path],
+                 chunksize: int, verbose: bool = False) -> Iterator[Tuple[bool, str, NoteMarkdownConverter]]:
+    """プロセスプールでファイルを変換し、結果を入力順に返します。
+    
+    プロセスプール自体の異常（BrokenProcessPool、pickle失敗）が発生した場合は、
+    結果を取得できなかった残りのファイルをエラーとして返します。
+    
+    Args:
+        worker (Callable[[Path], Tuple[bool, str, NoteMarkdownConverter]]): 1ファイルを変換する関数。
+        md_files (List[Path]): 変換対象の.mdファイルのリスト。
+        chunksize (int): 1回のプロセス間通信でワーカーに渡すファイル数。
+        verbose (bool): 詳細なログを出力するかどうか。デフォルトはFalse。
+    
+    Yields:
+        Tuple[bool, str, NoteMarkdownConverter]: _convert_one と同じ形式の結果。
+    """
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(worker, md_files, chunksize=chunksize)
+        for index in range(len(md_files)):
+            try:
+                result = next(results)
+            except (BrokenProcessPool, PicklingError) as e:
+                # 異常発生時に処理中だったファイルは書き込み済みの可能性もある
+                for md_file in md_files[index:]:
+                    message = f"❌ エラー: {md_file.name} - 変換結果を取得できませんでした（出力済みの可能性があります）: {e}"
+                    yield False, message, NoteMarkdownConverter(verbose=verbose)
+                return
+            yield result
 
 
 def process_folder(input_folder: Path, dry_run: bool = False, verbose: bool = False, exclude_patterns: Optional[List[str]] = None):
@@ -575,19 +835,11 @@ def process_folder(input_folder: Path, dry_run: bool = False, verbose: bool = Fa
         print(f"❌ エラー: ディレクトリではありません: {input_folder}")
         sys.exit(1)
     
-    # .mdファイルを検索
-    md_files = list(input_folder.rglob('*.md'))
+    # 除外パターン（部分一致）を1つの正規表現にまとめる
+    exclude_re = re.compile('|'.join(map(re.escape, exclude_patterns))) if exclude_patterns else None
     
-    # 除外パターンを適用
-    if exclude_patterns:
-        filtered_files = []
-        for f in md_files:
-            if not any(pattern in str(f) for pattern in exclude_patterns):
-                filtered_files.append(f)
-        md_files = filtered_files
-    
-    # .note.mdファイルは除外
-    md_files = [f for f in md_files if not f.name.endswith('.note.md')]
+    # .mdファイルを検索（除外パターンと.note.mdファイルは走査中に除外）
+    md_files = list(_iter_md_files(input_folder, exclude_re))
     
     if not md_files:
         print(f"⚠️  {input_folder} 内に変換対象の.mdファイルが見つかりませんでした")
@@ -598,29 +850,23 @@ def process_folder(input_folder: Path, dry_run: bool = False, verbose: bool = Fa
     converter = NoteMarkdownConverter(verbose=verbose)
     success_count = 0
     
-    for md_file in md_files:
-        try:
-            # ファイルを読み込み
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 変換
-            converted = converter.convert(content, str(md_file))
-            
-            # 出力ファイル名を生成
-            output_file = md_file.parent / f"{md_file.stem}.note.md"
-            
-            if dry_run:
-                print(f"[DRY-RUN] {md_file.name} → {output_file.name}")
-            else:
-                # ファイルに書き込み
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(converted)
-                print(f"✅ {md_file.name} → {output_file.name}")
-                success_count += 1
-        
-        except Exception as e:
-            print(f"❌ エラー: {md_file.name} - {e}")
+    # ファイル単位で並列に変換（結果は入力順に返る）
+    # ファイルが1つ、またはCPUが1つの場合はプロセス間通信のコストが上回るため直列で変換
+    worker = partial(_convert_one, verbose=verbose, dry_run=dry_run)
+    cpu_count = os.cpu_count() or 1
+    serial = len(md_files) == 1 or cpu_count == 1
+    if serial:
+        results = map(worker, md_files)
+    else:
+        chunksize = max(1, len(md_files) // (cpu_count * 4))
+        results = _map_in_pool(worker, md_files, chunksize, verbose)
+    
+    # 完了した順ではなく入力順に、結果が揃い次第表示
+    for ok, message, file_converter in results:
+        print(message)
+        converter.merge_warnings(file_converter)
+        if ok:
+            success_count += 1
     
     # 警告レポートを表示
     converter.print_warnings()